@@ -0,0 +1,58 @@
+# bench_import.py
+# `import core` 시간/메모리 측정 + 무거운 라이브러리가 import 시점에 로드되지 않는지 확인
+#   python bench_import.py [--max-seconds 0.5] [--max-rss-mb 60]
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+HEAVY = ("streamlit", "pandas", "numpy", "requests")
+
+_PROBE = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+import core
+dt = time.perf_counter() - t0
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024  # macOS: bytes, Linux: KB
+print(json.dumps({"seconds": dt, "rss_mb": rss_mb,
+                  "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY,)
+
+
+def measure(runs=5):
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True,
+                             cwd=_HERE)
+        results.append(json.loads(out.stdout))
+    best = min(results, key=lambda r: r["seconds"])
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--max-seconds", type=float, default=0.5)
+    ap.add_argument("--max-rss-mb", type=float, default=60.0)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    r = measure(args.runs)
+    print(f"import core: {r['seconds'] * 1000:.1f} ms, max RSS {r['rss_mb']:.1f} MB, heavy loaded={r['loaded']}")
+
+    errors = []
+    if r["loaded"]:
+        errors.append(f"heavy modules imported at load time: {r['loaded']}")
+    if r["seconds"] > args.max_seconds:
+        errors.append(f"import time {r['seconds']:.3f}s > {args.max_seconds}s")
+    if r["rss_mb"] > args.max_rss_mb:
+        errors.append(f"RSS {r['rss_mb']:.1f}MB > {args.max_rss_mb}MB")
+    for e in errors:
+        print("FAIL:", e)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,148 @@
+from __future__ import annotations
+
+import importlib
 import os
-import requests
-import pandas as pd
-import numpy as np
+import re
+import tempfile
+import zipfile
+from datetime import date
 
 try:
-    import streamlit as st
-    _DART_KEY_FROM_SECRETS = st.secrets.get("DART_API_KEY", "")
-except Exception:
-    _DART_KEY_FROM_SECRETS = ""
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        tomllib = None
+
+
+class _LazyModule:
+    """첫 속성 접근 시점에 실제 모듈을 import 하는 프록시 (import 시간/메모리 절약용)."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# 무거운 라이브러리는 실제로 쓰일 때 import (raw 모드에서는 pandas/numpy를 아예 불러오지 않음)
+requests = _LazyModule("requests")
+pd = _LazyModule("pandas")
+np = _LazyModule("numpy")
 
-api_key = _DART_KEY_FROM_SECRETS or os.getenv("DART_API_KEY", "")
+_NAN = float("nan")  # np.nan 과 같은 값 (numpy 없이 결측 표시)
+
+# ──────────────────────────────────────────────
+# 설정/비밀값: Streamlit 없이 secrets.toml → 환경변수 순으로 조회
+# ──────────────────────────────────────────────
+_SECRETS_PATHS = (
+    os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml"),       # 전역
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".streamlit", "secrets.toml"),
+    os.path.join(os.getcwd(), ".streamlit", "secrets.toml"),                   # 프로젝트(우선)
+)
+if tomllib is None and any(os.path.exists(p) for p in _SECRETS_PATHS):
+    print("Secrets Warning: secrets.toml 을 읽으려면 Python 3.11+ 또는 tomli 가 필요합니다 (환경변수만 사용)")
+
+def _load_secrets() -> dict:
+    secrets = {}
+    if tomllib is None:
+        return secrets
+    for path in _SECRETS_PATHS:
+        try:
+            with open(path, "rb") as f:
+                secrets.update(tomllib.load(f))
+        except (OSError, tomllib.TOMLDecodeError):
+            continue
+    return secrets
+
+def get_secret(name: str, default: str = "") -> str:
+    """st.secrets 와 같은 secrets.toml 을 직접 읽고, 없으면 환경변수를 사용."""
+    value = _load_secrets().get(name)
+    return str(value) if value else os.getenv(name, default)
+
+api_key = get_secret("DART_API_KEY")
+
+# 원문/색인/XBRL/이벤트 상태 등 로컬 캐시 루트
+CACHE_DIR = get_secret("DART_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "dartkit")
 
 def set_api_key(k: str | None):
     """(옵션) 앱에서 키를 주입하고 싶을 때 사용. 내재화만 쓰면 호출 안해도 됨."""
     global api_key
     api_key = (k or "").strip()
 
-def get_json(url, params=None, timeout=30):
+# ──────────────────────────────────────────────
+# 결과 형식: "pandas"(기본, DataFrame) / "raw"(list[dict], pandas 불필요)
+# ──────────────────────────────────────────────
+RESULT_MODES = ("pandas", "raw")
+result_mode = (os.getenv("DART_RESULT_MODE") or "pandas").strip().lower()
+
+def set_result_mode(mode: str | None):
+    """조회 메서드의 반환 형식 지정. 배치/CLI에서는 "raw"로 두면 pandas를 import 하지 않음."""
+    global result_mode
+    mode = (mode or "pandas").strip().lower()
+    if mode not in RESULT_MODES:
+        raise ValueError(f"result_mode must be one of {RESULT_MODES}: {mode!r}")
+    result_mode = mode
+
+def _raw() -> bool:
+    return result_mode == "raw"
+
+def _is_missing(v) -> bool:
+    return v is None or (isinstance(v, float) and v != v)
+
+def _plain(records):
+    """NaN → None 으로 바꾼 dict 리스트 (raw 모드 반환값)."""
+    return [{k: (None if _is_missing(v) else v) for k, v in r.items()} for r in records]
+
+def _frame(records):
+    """레코드 리스트를 현재 결과 형식(DataFrame 또는 list[dict])으로 변환."""
+    if _raw():
+        return _plain(records)
+    return pd.DataFrame(records)
+
+def _records(result):
+    """조회 결과(DataFrame / raw list / None) → NaN 없는 dict 리스트."""
+    if result is None:
+        return []
+    if hasattr(result, "to_dict"):
+        result = result.to_dict("records")
+    return _plain(result)
+
+def _to_number(x):
+    """pd.to_numeric(errors="coerce") 의 스칼라 버전 (raw 모드용)."""
+    if _is_missing(x):
+        return None
+    if isinstance(x, (int, float)):
+        return x
+    s = str(x).strip()
+    try:
+        return int(s)
+    except ValueError:
+        pass
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+def _parse_date(s):
+    """yyyy-mm-dd / yyyymmdd → date (실패 시 None)."""
+    if _is_missing(s):
+        return None
+    s = str(s).strip()
+    if len(s) == 8 and s.isdigit():
+        s = f"{s[:4]}-{s[4:6]}-{s[6:]}"
+    try:
+        return date.fromisoformat(s)
+    except ValueError:
+        return None
+
+def get_json(url, params=None, timeout=30, empty_ok=False):
+    """DART JSON 조회. 실패 시 None.
+    empty_ok=True 면 '013'(조회된 데이터 없음)을 오류가 아닌 빈 결과로 돌려줌 (실패와 구분용)."""
     try:
         res = requests.get(url, params=params, timeout=timeout)
         res.raise_for_status()
@@ -33,34 +159,77 @@ def get_json(url, params=None, timeout=30):
 
     status = data.get("status")
     message = data.get("message")
+    if empty_ok and status == "013":
+        return {**data, "list": []}
     if status != "000":
         print(f"Dart Error = '{status}','{message}'")
         return None
 
     return data
 
+def get_zip(url, params=None, dest_dir=None, timeout=60, chunk_size=64 * 1024):
+    """zip 응답을 메모리에 올리지 않고 임시파일로 스트리밍 저장 후 경로 반환 (삭제는 호출 측).
+    실패 시 None. 오류일 때 DART는 zip 대신 <result><status>…</status> XML을 돌려줌."""
+    try:
+        res = requests.get(url, params=params, timeout=timeout, stream=True)
+        res.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"Request Error: {e}")
+        return None
+
+    fd, path = tempfile.mkstemp(suffix=".zip", dir=dest_dir)
+    with res, os.fdopen(fd, "wb") as f:
+        for chunk in res.iter_content(chunk_size):
+            f.write(chunk)
+
+    if not zipfile.is_zipfile(path):
+        with open(path, "rb") as f:
+            head = f.read(2048).decode("utf-8", errors="replace")
+        os.remove(path)
+        status = re.search(r"<status>(.*?)</status>", head)
+        message = re.search(r"<message>(.*?)</message>", head)
+        print(f"Dart Error = '{status.group(1) if status else ''}','{message.group(1) if message else ''}'")
+        return None
+    return path
+
 # ──────────────────────────────────────────────
 # 현금유입 총괄 (신주/채권/예탁증권)
 # ──────────────────────────────────────────────
 class CashIn:
     _COLS = ["구분","납입기일","증권의 종류","발행금액","조달목적","원본"]  # 원본: 어떤 API에서 왔는지
 
+    # 날짜(yyyymmdd → yyyy-mm-dd)
+    @staticmethod
+    def _fmt_date(s):
+        if _is_missing(s): return _NAN
+        s = str(s)
+        if len(s) == 8 and s.isdigit():
+            return f"{s[:4]}-{s[4:6]}-{s[6:]}"
+        return s
+
+    @staticmethod
+    def _normalize_records(records: list[dict] | None, source: str) -> list[dict]:
+        """_normalize_df 의 raw 모드 버전 (pandas 없이 dict 리스트 정규화)."""
+        out = []
+        for r in records or []:
+            out.append({
+                "구분": r.get("구분"),
+                "납입기일": CashIn._fmt_date(r.get("납입기일")),
+                "증권의 종류": r.get("증권의 종류"),
+                "발행금액": _to_number(r.get("발행금액")),
+                "조달목적": r.get("조달목적"),
+                "원본": source,
+            })
+        return _plain(out)
+
     @staticmethod
     def _normalize_df(df: pd.DataFrame | None, source: str) -> pd.DataFrame:
         if df is None or len(df) == 0:
             return pd.DataFrame(columns=CashIn._COLS)
 
-        # 날짜(yyyymmdd → yyyy-mm-dd)
-        def _fmt_date(s):
-            if pd.isna(s): return np.nan
-            s = str(s)
-            if len(s) == 8 and s.isdigit():
-                return f"{s[:4]}-{s[4:6]}-{s[6:]}"
-            return s
-
         df = df.copy()
         if "납입기일" in df.columns:
-            df["납입기일"] = df["납입기일"].apply(_fmt_date)
+            df["납입기일"] = df["납입기일"].apply(CashIn._fmt_date)
 
         if "발행금액" in df.columns:
             df["발행금액"] = pd.to_numeric(df["발행금액"], errors="coerce")
@@ -69,7 +238,7 @@ class CashIn:
 
         for c in CashIn._COLS:
             if c not in df.columns:
-                df[c] = np.nan
+                df[c] = _NAN
         return df[CashIn._COLS]
 
     @staticmethod
@@ -83,12 +252,12 @@ class CashIn:
         for i in data.get("list", []):
             records.append({
                 "구분": "신주발행",
-                "납입기일": i.get("pymd", np.nan),
-                "증권의 종류": i.get("stksen", np.nan),
-                "발행금액": i.get("amt", np.nan),
-                "조달목적": i.get("se", np.nan),
+                "납입기일": i.get("pymd", _NAN),
+                "증권의 종류": i.get("stksen", _NAN),
+                "발행금액": i.get("amt", _NAN),
+                "조달목적": i.get("se", _NAN),
             })
-        return pd.DataFrame(records)
+        return _frame(records)
 
     @staticmethod
     def CashInBond(corp_code, bgn_de='20210101', end_de='20251231'):
@@ -101,12 +270,12 @@ class CashIn:
         for i in data.get("list", []):
             records.append({
                 "구분": "채권발행",
-                "납입기일": i.get("pymd", np.nan),
-                "증권의 종류": i.get("bdnmn", np.nan),
-                "발행금액": i.get("amt", np.nan),
-                "조달목적": i.get("se", np.nan),
+                "납입기일": i.get("pymd", _NAN),
+                "증권의 종류": i.get("bdnmn", _NAN),
+                "발행금액": i.get("amt", _NAN),
+                "조달목적": i.get("se", _NAN),
             })
-        return pd.DataFrame(records)
+        return _frame(records)
 
     @staticmethod
     def CashInYe(corp_code, bgn_de='20210101', end_de='20251231'):
@@ -119,15 +288,51 @@ class CashIn:
         for i in data.get("list", []):
             records.append({
                 "구분": "증권예탁증권",
-                "납입기일": i.get("pymd", np.nan),
-                "증권의 종류": i.get("stksen", np.nan),
-                "발행금액": i.get("amt", np.nan),
-                "조달목적": i.get("se", np.nan),
+                "납입기일": i.get("pymd", _NAN),
+                "증권의 종류": i.get("stksen", _NAN),
+                "발행금액": i.get("amt", _NAN),
+                "조달목적": i.get("se", _NAN),
             })
-        return pd.DataFrame(records)
+        return _frame(records)
 
     @staticmethod
-    def CashInSummary(corp_code, bgn_de='20210101', end_de='20251231', sort_desc=True) -> pd.DataFrame:
+    def CashInDecision(corp_code, bgn_de='20210101', end_de='20251231'):
+        url = "https://opendart.fss.or.kr/api/piicDecsn.json"  # 유상증자 결정 (주요사항보고서)
+        data = get_json(url, params={"crtfc_key": api_key, "corp_code": corp_code,
+                                     "bgn_de": bgn_de, "end_de": end_de})
+        if not data or "list" not in data:
+            return None
+        records = []
+        for i in data.get("list", []):
+            records.append({
+                "접수번호": i.get("rcept_no", _NAN),
+                "증자방식": i.get("ic_mthn", _NAN),
+                "신주 보통주식수": i.get("nstk_ostk_cnt", _NAN),
+                "신주 기타주식수": i.get("nstk_estk_cnt", _NAN),
+                "1주당 액면가액": i.get("fv_ps", _NAN),
+                "증자전 보통주식총수": i.get("bfic_tisstk_ostk", _NAN),
+                "증자전 기타주식총수": i.get("bfic_tisstk_estk", _NAN),
+                "시설자금": i.get("fdpp_fclt", _NAN),
+                "영업양수자금": i.get("fdpp_bsninh", _NAN),
+                "운영자금": i.get("fdpp_op", _NAN),
+                "채무상환자금": i.get("fdpp_dtrp", _NAN),
+                "타법인증권취득자금": i.get("fdpp_ocsa", _NAN),
+                "기타자금": i.get("fdpp_etc", _NAN),
+            })
+        return _frame(records)
+
+    @staticmethod
+    def CashInSummary(corp_code, bgn_de='20210101', end_de='20251231', sort_desc=True) -> pd.DataFrame | list[dict]:
+        if _raw():
+            rows = (CashIn._normalize_records(CashIn.CashInStock(corp_code, bgn_de, end_de), "신주")
+                    + CashIn._normalize_records(CashIn.CashInBond(corp_code, bgn_de, end_de), "채권")
+                    + CashIn._normalize_records(CashIn.CashInYe(corp_code, bgn_de, end_de), "예탁증권"))
+            # 날짜 없는 행은 정렬 방향과 무관하게 뒤로 (pandas sort_values 와 동일)
+            dated = [r for r in rows if _parse_date(r["납입기일"]) is not None]
+            undated = [r for r in rows if _parse_date(r["납입기일"]) is None]
+            dated.sort(key=lambda r: _parse_date(r["납입기일"]), reverse=sort_desc)
+            return dated + undated
+
         dfs = []
         df_stock = CashIn.CashInStock(corp_code, bgn_de, end_de)
         dfs.append(CashIn._normalize_df(df_stock, "신주"))
@@ -156,7 +361,7 @@ class CorpInfo:
         base_url = "https://opendart.fss.or.kr/api/company.json"
         data = get_json(base_url, params={"crtfc_key": api_key, "corp_code": corp_code})
         if data is None:
-            return pd.DataFrame()
+            return _frame([])
 
         corp_cls_map = {"Y": "유가증권", "K": "코스닥", "N": "코넥스", "E": "기타법인"}
 
@@ -176,7 +381,7 @@ class CorpInfo:
             "홈페이지": data.get("hm_url"),
             "결산월": data.get("acc_mt"),
         }
-        return pd.DataFrame([corp_info])
+        return _frame([corp_info])
 
 
 class Shareholders:
@@ -187,7 +392,7 @@ class Shareholders:
         reprt_map = {11013: "1분기보고서", 11012: "반기보고서", 11014: "3분기보고서", 11011: "사업보고서"}
         reprt_codes = list(reprt_map.keys())
 
-        def pick(d, *keys, default=np.nan):
+        def pick(d, *keys, default=_NAN):
             for k in keys:
                 v = d.get(k)
                 if v not in (None, "", " "):
@@ -221,9 +426,11 @@ class Shareholders:
                         "변동사유": pick(it, "change_cause"),
                     }
                     records.append(rec)
-                frames.append(pd.DataFrame(records))
+                frames.append(_frame(records))
         if not frames:
-            return pd.DataFrame()
+            return _frame([])
+        if _raw():
+            return [r for f in frames for r in f]
         df = pd.concat(frames, ignore_index=True)
         preferred = ["사업연도", "보고서종류", "변동일", "최대주주명", "소유주식수", "지분율", "변동사유"]
         cols = [c for c in preferred if c in df.columns] + [c for c in df.columns if c not in preferred]
@@ -238,7 +445,7 @@ class Execturives:
         report_priority = {"사업보고서": 1, "3분기보고서": 2, "반기보고서": 3, "1분기보고서": 4}
         reprt_codes = list(reprt_map.keys())
 
-        def pick(d, *keys, default=np.nan):
+        def pick(d, *keys, default=_NAN):
             for k in keys:
                 v = d.get(k)
                 if v not in (None, "", " "):
@@ -276,10 +483,12 @@ class Execturives:
                         "임기만료일": pick(it, "tenure_end_on"),
                     }
                     records.append(rec)
-                frames.append(pd.DataFrame(records))
+                frames.append(_frame(records))
 
         if not frames:
-            return pd.DataFrame()
+            return _frame([])
+        if _raw():
+            return Execturives._latest_records([r for f in frames for r in f], report_priority)
         df = pd.concat(frames, ignore_index=True)
         df["_연도정렬"] = pd.to_numeric(df["사업연도"], errors="coerce")
         df["_보고서정렬"] = df["보고서종류"].map(report_priority).fillna(0).astype(int)
@@ -293,29 +502,47 @@ class Execturives:
         cols = [c for c in preferred if c in df.columns] + [c for c in df.columns if c not in preferred]
         return df[cols]
 
+    @staticmethod
+    def _latest_records(records, report_priority):
+        """get_execturives 의 raw 모드 중복 제거: (성명, 출생년월)별로 정렬상 첫 행만 유지."""
+        best = {}
+        for r in records:
+            key = (r["성명"], r["출생년월"])
+            rank = (_to_number(r["사업연도"]) or 0, report_priority.get(r["보고서종류"], 0))
+            if key not in best or rank > best[key][0]:
+                best[key] = (rank, r)
+        # 결측(None)은 pandas 정렬과 같이 뒤로
+        keys = sorted(best, key=lambda k: tuple((v is None, v or "") for v in k))
+        out = []
+        for k in keys:
+            rec = dict(best[k][1])
+            rec.pop("보고서코드", None)
+            out.append(rec)
+        return out
+
     @staticmethod
     def get_executive_shareholdings(corp_code):
         base_url = "https://opendart.fss.or.kr/api/elestock.json"
         data = get_json(base_url, params={"crtfc_key": api_key, "corp_code": corp_code})
         if data is None:
-            return pd.DataFrame()
+            return _frame([])
         items = data.get("list", []) or []
         if isinstance(items, dict):
             items = [items]
         if not items:
-            return pd.DataFrame()
+            return _frame([])
         records = []
         for item in items:
             rec = {
-                "공시접수일자": item.get("rcept_dt", np.nan),
-                "보고자": item.get("repror", np.nan),
-                "등기임원여부": item.get("isu_exctv_rgist_at", np.nan),
-                "직급": item.get("isu_exctv_ofcps", np.nan),
-                "주식수": item.get("sp_stock_lmp_cnt", np.nan),
-                "지분율": item.get("sp_stock_lmp_rate", np.nan),
+                "공시접수일자": item.get("rcept_dt", _NAN),
+                "보고자": item.get("repror", _NAN),
+                "등기임원여부": item.get("isu_exctv_rgist_at", _NAN),
+                "직급": item.get("isu_exctv_ofcps", _NAN),
+                "주식수": item.get("sp_stock_lmp_cnt", _NAN),
+                "지분율": item.get("sp_stock_lmp_rate", _NAN),
             }
             records.append(rec)
-        return pd.DataFrame(records)
+        return _frame(records)
 
 class ConvertBond:
     @staticmethod
@@ -323,39 +550,39 @@ class ConvertBond:
         base_url = 'https://opendart.fss.or.kr/api/cvbdIsDecsn.json'
         data = get_json(base_url, params={"crtfc_key": api_key, "corp_code": corp_code, "bgn_de": bgn_de, "end_de": end_de})
         if data is None:
-            return pd.DataFrame()
+            return _frame([])
         items = data.get("list", []) or []
         if isinstance(items, dict):
             items = [items]
         if not items:
-            return pd.DataFrame()
+            return _frame([])
         records = []
         for i in items:
             rec = {
-                "접수번호": i.get("rcept_no", np.nan),
-                "CB회차": i.get("bd_tm", np.nan),
-                "CB종류": i.get("cb_knd", np.nan),
-                "발행방법": i.get("bdis_mthn", np.nan),
-                "권면총액": i.get("bd_fta", np.nan),
-                "운영자금목적": i.get("fdpp_op", np.nan),
-                "채무상환목적": i.get("fdpp_dtrp", np.nan),
-                "타법인증권취득목적": i.get("fdpp_ocsa", np.nan),
-                "기타목적": i.get("fdpp_etc", np.nan),
-                "발행일": i.get("pymd", np.nan),
-                "만기일": i.get("bd_mtd", np.nan),
-                "표시이자율": i.get("bd_intr_ex", np.nan),
-                "만기이자율": i.get("bd_intr_sf", np.nan),
-                "전환비율": i.get("cv_rt", np.nan),
-                "주당 전환가액": i.get("cv_prc", np.nan),
-                "전환발행주식수": i.get("cvisstk_tisstk_vs", np.nan),
-                "전환청구 시작일": i.get("cvrqpd_bgdm", np.nan),
-                "전환청구 종료일": i.get("cvrqpd_edd", np.nan),
-                "전환가액 조정": i.get("act_mktprcfl_cvprc_lwtrsprc", np.nan),
-                "전환가액 조정 근거": i.get("act_mktprcfl_cvprc_lwtrsprc_bs", np.nan),
-                "전환가액 조정 하한": i.get("rmislmt_lt70p", np.nan),
+                "접수번호": i.get("rcept_no", _NAN),
+                "CB회차": i.get("bd_tm", _NAN),
+                "CB종류": i.get("cb_knd", _NAN),
+                "발행방법": i.get("bdis_mthn", _NAN),
+                "권면총액": i.get("bd_fta", _NAN),
+                "운영자금목적": i.get("fdpp_op", _NAN),
+                "채무상환목적": i.get("fdpp_dtrp", _NAN),
+                "타법인증권취득목적": i.get("fdpp_ocsa", _NAN),
+                "기타목적": i.get("fdpp_etc", _NAN),
+                "발행일": i.get("pymd", _NAN),
+                "만기일": i.get("bd_mtd", _NAN),
+                "표시이자율": i.get("bd_intr_ex", _NAN),
+                "만기이자율": i.get("bd_intr_sf", _NAN),
+                "전환비율": i.get("cv_rt", _NAN),
+                "주당 전환가액": i.get("cv_prc", _NAN),
+                "전환발행주식수": i.get("cvisstk_tisstk_vs", _NAN),
+                "전환청구 시작일": i.get("cvrqpd_bgdm", _NAN),
+                "전환청구 종료일": i.get("cvrqpd_edd", _NAN),
+                "전환가액 조정": i.get("act_mktprcfl_cvprc_lwtrsprc", _NAN),
+                "전환가액 조정 근거": i.get("act_mktprcfl_cvprc_lwtrsprc_bs", _NAN),
+                "전환가액 조정 하한": i.get("rmislmt_lt70p", _NAN),
             }
             records.append(rec)
-        return pd.DataFrame(records)
+        return _frame(records)
 
 class Lawsuits:
     @staticmethod
@@ -374,31 +601,49 @@ class Lawsuits:
             },
         )
         if data is None:
-            return pd.DataFrame()
+            return _frame([])
 
         items = data.get("list", [])
         if isinstance(items, dict):
             items = [items]
         if not items:
-            return pd.DataFrame()
+            return _frame([])
 
         records = []
         for it in items:
             rec = {
-                "접수번호": it.get("rcept_no", np.nan),
-                "사건의 명칭": it.get("icnm", np.nan),
-                "원고": it.get("ac_ap", np.nan),
-                "청구내용": it.get("rq_cn", np.nan),
-                "관할법원": it.get("cpct", np.nan),
-                "향후대책": it.get("ft_ctp", np.nan),
-                "제기일자": it.get("lgd", np.nan),
-                "확인일자": it.get("cfd", np.nan),
+                "접수번호": it.get("rcept_no", _NAN),
+                "사건의 명칭": it.get("icnm", _NAN),
+                "원고": it.get("ac_ap", _NAN),
+                "청구내용": it.get("rq_cn", _NAN),
+                "관할법원": it.get("cpct", _NAN),
+                "향후대책": it.get("ft_ctp", _NAN),
+                "제기일자": it.get("lgd", _NAN),
+                "확인일자": it.get("cfd", _NAN),
             }
             records.append(rec)
 
-        return pd.DataFrame(records)
+        return _frame(records)
 
 class FinancialIdx:
+    @staticmethod
+    def _pivot_records(rows):
+        """pivot_table(aggfunc="last") 의 raw 모드 버전: 행=(사업연도, 보고서종류), 열=지표명."""
+        wide, names = {}, set()
+        for r in rows:
+            if r["지표명"] is None:
+                continue
+            rec = wide.setdefault((r["사업연도"], r["보고서종류"]), {})
+            if r["지표값"] is not None:
+                rec[r["지표명"]] = r["지표값"]
+                names.add(r["지표명"])  # pivot_table 처럼 값이 하나도 없는 지표는 열에서 제외
+        cols = sorted(names)
+        return [
+            {"사업연도": yr, "보고서종류": rp, **{c: vals.get(c) for c in cols}}
+            for (yr, rp), vals in sorted(wide.items())
+            if vals
+        ]
+
     @staticmethod
     def get_financialidx(
         corp_code,
@@ -429,7 +674,9 @@ class FinancialIdx:
 
         def to_num(x):
             if x in (None, "", " "):
-                return pd.NA
+                return None if _raw() else pd.NA
+            if _raw():
+                return _to_number(str(x).replace(",", ""))
             return pd.to_numeric(str(x).replace(",", ""), errors="coerce")
 
         frames = []
@@ -463,20 +710,29 @@ class FinancialIdx:
                                 "사업연도": str(y),
                                 "보고서종류": reprt_map.get(rc, str(rc)),
                                 "지표군": idx_map.get(ig, ig),
-                                "지표명": it.get("idx_nm", pd.NA),
+                                "지표명": it.get("idx_nm", _NAN),
                                 "지표값": to_num(it.get("idx_val")),
                             }
                         )
                     if rows:
-                        frames.append(pd.DataFrame(rows))
+                        frames.append(_frame(rows))
 
         if not frames:
-            return pd.DataFrame()
-
-        df = pd.concat(frames, ignore_index=True)
+            return _frame([])
 
         # 정렬: 연도 ↑, 보고서(사업>3분기>반기>1분기), 지표군, 지표명
         order = {"사업보고서": 1, "3분기보고서": 2, "반기보고서": 3, "1분기보고서": 4}
+
+        if _raw():
+            rows = [r for f in frames for r in f]
+            rows.sort(key=lambda r: (_to_number(r["사업연도"]) or 0, order.get(r["보고서종류"], 9),
+                                     r["지표군"], r["지표명"] is None, r["지표명"] or ""))
+            if not pivot:
+                return rows
+            return FinancialIdx._pivot_records(rows)
+
+        df = pd.concat(frames, ignore_index=True)
+
         df["_yr"] = pd.to_numeric(df["사업연도"], errors="coerce")
         df["_ord"] = df["보고서종류"].map(order).fillna(9).astype(int)
         df = df.sort_values(["_yr", "_ord", "지표군", "지표명"]).drop(columns=["_yr", "_ord"]).reset_index(drop=True)
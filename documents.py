@@ -0,0 +1,268 @@
+# documents.py
+# 공시 원문(document.xml) 다운로드 → 텍스트 추출/디스크 캐시 → 로컬 전문(full-text) 역색인
+import codecs
+import json
+import os
+import re
+import zipfile
+from array import array
+from html.parser import HTMLParser
+
+import core
+
+DOCUMENT_URL = "https://opendart.fss.or.kr/api/document.xml"
+CACHE_DIR = core.CACHE_DIR  # 이전 import 경로 호환 (설정은 core)
+
+_CHUNK = 64 * 1024
+_MEMBER_SEP = "\f\n"  # zip 멤버 경계 (텍스트/색인에는 포함하지 않음)
+_MEMBER_LINE_RE = re.compile(r"\f[^\n]*\n?")
+_ENCODING_RE = re.compile(rb"""encoding\s*=\s*["']([A-Za-z0-9_\-]+)["']""")
+
+
+def _doc_dir(cache_dir=None):
+    path = os.path.join(cache_dir or core.CACHE_DIR, "documents")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _text_path(rcept_no, cache_dir=None):
+    return os.path.join(_doc_dir(cache_dir), f"{rcept_no}.txt")
+
+
+def download_document(rcept_no, cache_dir=None, timeout=60):
+    """document.xml zip을 임시파일로 저장하고 경로 반환. 실패 시 None (삭제는 호출 측)."""
+    return core.get_zip(
+        DOCUMENT_URL,
+        params={"crtfc_key": core.api_key, "rcept_no": rcept_no},
+        dest_dir=_doc_dir(cache_dir),
+        timeout=timeout,
+    )
+
+# ──────────────────────────────────────────────
+# 텍스트 추출 (zip 멤버를 청크 단위로 읽어 태그 제거)
+# ──────────────────────────────────────────────
+class _TextExtractor(HTMLParser):
+    """DART 원문(XML/HTML 혼합)에서 본문 텍스트만 out 파일로 흘려보내는 파서."""
+
+    _BREAK = {"p", "br", "tr", "title", "table", "cover-title", "section-1", "section-2", "section-3"}
+    _CELL = {"td", "th", "te", "tu"}
+    _SKIP = {"style", "script"}
+
+    def __init__(self, out):
+        super().__init__(convert_charrefs=True)
+        self.out = out
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skip += 1
+        elif tag in self._CELL:
+            self.out.write("\t")
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP:
+            self._skip = max(0, self._skip - 1)
+        elif tag in self._BREAK:
+            self.out.write("\n")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.out.write(data)
+
+
+def _extract_member(zf, name, out):
+    with zf.open(name) as f:
+        head = f.read(_CHUNK)
+        m = _ENCODING_RE.search(head[:512])
+        encoding = m.group(1).decode("ascii") if m else "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        parser = _TextExtractor(out)
+        chunk = head
+        while chunk:
+            parser.feed(decoder.decode(chunk))
+            chunk = f.read(_CHUNK)
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+
+
+def extract_text(zip_path, text_path):
+    """zip 내 모든 멤버의 텍스트를 text_path 로 기록 (멤버 단위 스트리밍)."""
+    tmp = text_path + ".part"
+    with zipfile.ZipFile(zip_path) as zf, open(tmp, "w", encoding="utf-8") as out:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            out.write(_MEMBER_SEP)
+            _extract_member(zf, info.filename, out)
+            out.write("\n")
+    os.replace(tmp, text_path)
+    return text_path
+
+
+def fetch_document(rcept_no, cache_dir=None, refresh=False):
+    """접수번호의 원문 텍스트 경로 반환 (디스크 캐시 우선). 실패 시 None."""
+    rcept_no = str(rcept_no).strip()
+    text_path = _text_path(rcept_no, cache_dir)
+    if not refresh and os.path.exists(text_path):
+        return text_path
+
+    zip_path = download_document(rcept_no, cache_dir)
+    if zip_path is None:
+        return None
+    try:
+        return extract_text(zip_path, text_path)
+    except (zipfile.BadZipFile, OSError) as e:
+        print(f"Document Error: {rcept_no}: {e}")
+        return None
+    finally:
+        os.remove(zip_path)
+
+
+def get_document_text(rcept_no, cache_dir=None, refresh=False):
+    path = fetch_document(rcept_no, cache_dir, refresh)
+    if path is None:
+        return None
+    with open(path, encoding="utf-8") as f:
+        # 멤버 경계 줄 제거 (이전 캐시의 '\f파일명' 줄 포함)
+        return _MEMBER_LINE_RE.sub("", f.read())
+
+# ──────────────────────────────────────────────
+# 전문 역색인: 한글은 음절 bigram, 영문/숫자는 단어 단위 토큰
+# ──────────────────────────────────────────────
+_HANGUL_RE = re.compile(r"[가-힣]+")
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _tokens(text):
+    toks = set()
+    for run in _HANGUL_RE.findall(text):
+        if len(run) == 1:
+            toks.add(run)
+        else:
+            toks.update(run[i:i + 2] for i in range(len(run) - 1))
+    toks.update(w.lower() for w in _WORD_RE.findall(text))
+    return toks
+
+
+def _receipts(obj):
+    """접수번호(문자열 하나 또는 iterable) / core 조회 결과(DataFrame 또는 raw list[dict]) → 접수번호 리스트."""
+    if isinstance(obj, str):
+        obj = [obj]
+    if hasattr(obj, "columns"):
+        obj = obj["접수번호"].dropna().tolist() if "접수번호" in obj.columns else []
+    out = []
+    for x in obj:
+        if isinstance(x, dict):
+            x = x.get("접수번호")
+        if x:
+            out.append(str(x).strip())
+    return out
+
+
+class DocumentIndex:
+    """접수번호 단위 로컬 역색인. 문서 id는 추가 순서대로 증가하므로 posting 은 항상 정렬 상태."""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir or core.CACHE_DIR, "document_index.json")
+        self.docs = []       # doc id → 접수번호
+        self._ids = {}       # 접수번호 → doc id
+        self.postings = {}   # token → array('I') [doc id, ...]
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, rcept_no):
+        return str(rcept_no) in self._ids
+
+    def add(self, rcept_no, text):
+        """텍스트를 색인에 추가 (이미 있는 접수번호는 무시; 공시 원문은 불변)."""
+        rcept_no = str(rcept_no)
+        if rcept_no in self._ids:
+            return False
+        doc_id = len(self.docs)
+        self.docs.append(rcept_no)
+        self._ids[rcept_no] = doc_id
+        for tok in _tokens(text):
+            self.postings.setdefault(tok, array("I")).append(doc_id)
+        return True
+
+    def add_document(self, rcept_no):
+        rcept_no = str(rcept_no).strip()
+        if rcept_no in self._ids:
+            return False
+        text = get_document_text(rcept_no, self.cache_dir)
+        if text is None:
+            return False
+        return self.add(rcept_no, text)
+
+    def _postings(self, tok):
+        """토큰의 posting. 한 음절 한글은 bigram 으로만 색인되므로 그 음절을 포함하는 키들의 합집합."""
+        if len(tok) == 1 and _HANGUL_RE.match(tok):
+            hits = set()
+            for key, p in self.postings.items():
+                if tok in key:
+                    hits.update(p)
+            return hits
+        return self.postings.get(tok, ())
+
+    def build(self, receipts):
+        """접수번호 목록(또는 ConvertBond/Lawsuits 조회 결과)을 받아 증분 색인. 새로 추가된 건수 반환."""
+        return sum(self.add_document(r) for r in _receipts(receipts))
+
+    def search(self, query, limit=50, verify=False):
+        """모든 토큰을 포함하는 문서를 최신 접수번호순으로 반환.
+        verify=True: 캐시된 원문에서 검색어를 직접 확인(bigram 오탐 제거)하고 발췌를 붙임."""
+        toks = _tokens(query)
+        if not toks:
+            return core._frame([])
+        lists = sorted((self._postings(t) for t in toks), key=len)
+        hits = set(lists[0])
+        for p in lists[1:]:
+            if not hits:
+                break
+            hits.intersection_update(p)
+        rcepts = sorted((self.docs[i] for i in hits), reverse=True)
+
+        records = []
+        phrase = _SPACE_RE.sub(" ", query).strip().lower()  # 색인과 같이 대소문자 무시
+        for r in rcepts:
+            if len(records) >= limit:
+                break
+            rec = {"접수번호": r}
+            if verify:
+                text = get_document_text(r, self.cache_dir) or ""
+                flat = _SPACE_RE.sub(" ", text)
+                pos = flat.lower().find(phrase)
+                if pos < 0:
+                    continue
+                rec["발췌"] = flat[max(0, pos - 60):pos + len(phrase) + 60]
+            records.append(rec)
+        return core._frame(records)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".part"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"docs": self.docs, "postings": {t: p.tolist() for t, p in self.postings.items()}},
+                      f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    @classmethod
+    def load(cls, cache_dir=None):
+        """저장된 색인을 읽어오고, 없으면 빈 색인 반환."""
+        idx = cls(cache_dir)
+        try:
+            with open(idx.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return idx
+        idx.docs = data.get("docs", [])
+        idx._ids = {r: i for i, r in enumerate(idx.docs)}
+        idx.postings = {t: array("I", p) for t, p in data.get("postings", {}).items()}
+        return idx
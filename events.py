@@ -0,0 +1,239 @@
+# events.py
+# 일별 공시목록(list.json)을 한 번 훑어 새 접수번호 중 자금조달/CB/최대주주변경 공시만 상세 API로 보내고
+# 타입이 붙은 이벤트를 큐/파일 싱크로 내보냄 → 비용이 회사 수가 아니라 신규 공시 수에 비례
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import date
+
+import core
+
+LIST_URL = "https://opendart.fss.or.kr/api/list.json"
+
+SHARE_ISSUE = "share_issue"
+BOND_ISSUE = "bond_issue"
+DEPOSITARY_ISSUE = "depositary_issue"
+CONVERTIBLE_BOND = "convertible_bond"
+CONTROL_CHANGE = "control_change"
+
+
+@dataclass
+class Event:
+    """detail: 상세 API 결과(list[dict]). 주요사항보고서(CB/유상증자)는 해당 접수번호 행,
+    증권신고서는 접수일 기준 요약, control_change 는 최대주주 변동 이력(참고용).
+    detail_error: 상세 조회가 실패해 detail 이 비어 있음 (데이터 없음 '013' 과 구분, 소비 측에서 재조회)."""
+
+    type: str
+    rcept_no: str
+    rcept_dt: str
+    corp_code: str
+    corp_name: str
+    report_nm: str
+    amended: bool = False            # [기재정정] 등 정정 공시 여부
+    detail: list = field(default_factory=list)
+    detail_error: bool = False
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _yyyymmdd(d):
+    return d.strftime("%Y%m%d")
+
+
+def _cashin(fn):
+    def detail(item):
+        return fn(item["corp_code"], item["rcept_dt"], item["rcept_dt"])
+    return detail
+
+
+def _by_receipt(fn):
+    """접수일 하루로 조회한 뒤 해당 접수번호 행만 남김 (없으면 빈 리스트; 같은 날 다른 공시는 붙이지 않음)."""
+    def detail(item):
+        rows = core._records(fn(item["corp_code"], item["rcept_dt"], item["rcept_dt"]))
+        return [r for r in rows if r.get("접수번호") == item["rcept_no"]]
+    return detail
+
+
+def _major_shareholders(item):
+    """최대주주 변동 이력 (정기보고서 기반). 이벤트 접수번호와 직접 연결되지 않는 참고용 맥락."""
+    year = int(item["rcept_dt"][:4])
+    return core.Shareholders.get_major_shareholders(item["corp_code"], years=range(year - 1, year + 1))
+
+
+def _fetch_detail(detail_fn, item):
+    """detail_fn(item) → (records, ok).
+    core 조회 함수는 요청 실패와 '013'(데이터 없음)을 모두 빈 결과로 돌려주므로, 조회하는 동안만
+    get_json 을 empty_ok=True 로 감싸 실패(None)가 한 번이라도 있으면 ok=False."""
+    get_json = core.get_json
+    failed = []
+
+    def checked(url, params=None, timeout=30, empty_ok=False):
+        data = get_json(url, params=params, timeout=timeout, empty_ok=True)
+        if data is None:
+            failed.append(url)
+        return data
+
+    core.get_json = checked
+    try:
+        records = core._records(detail_fn(item))
+    finally:
+        core.get_json = get_json
+    return ([], False) if failed else (records, True)
+
+
+# (이벤트 타입, 공시유형 pblntf_ty, report_nm 패턴, 상세 조회 함수)
+# B: 주요사항보고, C: 발행공시, I: 거래소공시
+RULES = [
+    (SHARE_ISSUE, "C", re.compile(r"증권신고서\(지분증권\)"), _cashin(core.CashIn.CashInStock)),
+    (SHARE_ISSUE, "B", re.compile(r"유상증자결정"), _by_receipt(core.CashIn.CashInDecision)),
+    (BOND_ISSUE, "C", re.compile(r"증권신고서\(채무증권\)"), _cashin(core.CashIn.CashInBond)),
+    (DEPOSITARY_ISSUE, "C", re.compile(r"증권신고서\(증권예탁증권\)"), _cashin(core.CashIn.CashInYe)),
+    (CONVERTIBLE_BOND, "B", re.compile(r"전환사채권?발행결정"), _by_receipt(core.ConvertBond.get_convert_bond)),
+    (CONTROL_CHANGE, "I", re.compile(r"최대주주(등)?(의)?변경"), _major_shareholders),
+]
+
+
+class FeedError(RuntimeError):
+    """공시목록 조회 실패 (조회 결과 없음 '013' 은 실패가 아님)."""
+
+
+def iter_feed(bgn_de, end_de, pblntf_ty=None, page_count=100):
+    """list.json 을 페이지 단위로 순회하며 공시 항목(dict)을 yield. 페이지 조회 실패 시 FeedError."""
+    page = 1
+    while True:
+        params = {"crtfc_key": core.api_key, "bgn_de": bgn_de, "end_de": end_de,
+                  "page_no": page, "page_count": page_count}
+        if pblntf_ty:
+            params["pblntf_ty"] = pblntf_ty
+        data = core.get_json(LIST_URL, params=params, empty_ok=True)
+        if data is None:
+            raise FeedError(f"list.json 조회 실패: pblntf_ty={pblntf_ty} page={page} ({bgn_de}~{end_de})")
+        yield from data.get("list", []) or []
+        if page >= int(data.get("total_page") or 1):
+            return
+        page += 1
+
+
+def classify(item, rules=RULES):
+    """공시 항목 → 일치하는 규칙 (없으면 None)."""
+    name = item.get("report_nm") or ""
+    for rule in rules:
+        if rule[2].search(name):
+            return rule
+    return None
+
+
+class JsonlSink:
+    """이벤트를 JSON Lines 파일에 한 줄씩 추가."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, event):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event.to_dict(), ensure_ascii=False, default=_json_default) + "\n")
+
+
+def _json_default(v):
+    return v.item() if hasattr(v, "item") else str(v)
+
+
+class EventDetector:
+    """공시유형별 마지막 스캔 일자와 그 이후 이미 처리한 접수번호만 상태로 저장해 증분 스캔.
+    sinks: 이벤트를 받는 callable 목록 (queue.Queue().put, JsonlSink(...) 등).
+    싱크 전달까지 끝난 접수번호만 처리 완료로 기록하므로 중간 실패 시에는 다음 실행에서 다시 시도(at-least-once)."""
+
+    def __init__(self, sinks=(), state_path=None, rules=RULES, fetch_detail=True):
+        self.sinks = list(sinks)
+        self.state_path = state_path or os.path.join(core.CACHE_DIR, "event_state.json")
+        self.rules = rules
+        self.fetch_detail = fetch_detail
+        self.last_dates = {}   # pblntf_ty → 마지막으로 끝까지 스캔한 end_de
+        self.seen = set()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        last = state.get("last_date")
+        if isinstance(last, str):  # 이전 형식: 모든 유형 공통 일자
+            last = {ty: last for ty in self._types()}
+        self.last_dates = dict(last or {})
+        self.seen = set(state.get("seen", []))
+
+    def _save(self):
+        # 모든 유형의 마지막 스캔일이 있을 때만, 다시 스캔 범위에 들어올 수 있는 일자(가장 이른 날) 이후 분만 유지
+        if all(ty in self.last_dates for ty in self._types()):
+            floor = min(self.last_dates[ty] for ty in self._types())
+            self.seen = {r for r in self.seen if r[:8] >= floor}  # 접수번호 앞 8자리 = 접수일
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp = self.state_path + ".part"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"last_date": self.last_dates, "seen": sorted(self.seen)}, f)
+        os.replace(tmp, self.state_path)
+
+    def _types(self):
+        return sorted({r[1] for r in self.rules})
+
+    def scan(self, bgn_de=None, end_de=None):
+        """공시유형별로 bgn_de(기본: 해당 유형의 마지막 스캔일 또는 end_de)~end_de(기본: 오늘)를 훑어
+        새 이벤트 리스트 반환. 목록 조회가 실패한 유형은 마지막 스캔일을 옮기지 않고,
+        나머지 유형까지 처리·저장한 뒤 FeedError 를 올림 (e.events 에 이번에 내보낸 이벤트)."""
+        end_de = end_de or _yyyymmdd(date.today())
+
+        events = []
+        failed = []
+        try:
+            for pblntf_ty in self._types():
+                rules = [r for r in self.rules if r[1] == pblntf_ty]
+                start = bgn_de or self.last_dates.get(pblntf_ty) or end_de
+                try:
+                    for item in iter_feed(start, end_de, pblntf_ty):
+                        rcept_no = item.get("rcept_no")
+                        if not rcept_no or rcept_no in self.seen:
+                            continue
+                        rule = classify(item, rules)
+                        if rule is None:
+                            continue
+                        events.append(self._emit(rule, item))
+                        self.seen.add(rcept_no)
+                except FeedError as e:
+                    print(f"Feed Error: {e}")
+                    failed.append(e)
+                    continue
+                self.last_dates[pblntf_ty] = max(end_de, self.last_dates.get(pblntf_ty) or end_de)
+        finally:
+            # 상세 조회/싱크 예외로 중단돼도 이미 내보낸 접수번호는 기록
+            self._save()
+
+        if failed:
+            err = FeedError("; ".join(str(e) for e in failed))
+            err.events = events
+            raise err
+        return events
+
+    def _emit(self, rule, item):
+        ev_type, _, _, detail_fn = rule
+        name = item.get("report_nm") or ""
+        event = Event(
+            type=ev_type,
+            rcept_no=item["rcept_no"],
+            rcept_dt=item.get("rcept_dt", ""),
+            corp_code=item.get("corp_code", ""),
+            corp_name=item.get("corp_name", ""),
+            report_nm=name.strip(),
+            amended=name.lstrip().startswith("["),
+        )
+        if self.fetch_detail:
+            event.detail, ok = _fetch_detail(detail_fn, item)
+            if not ok:
+                print(f"Detail Error: {event.rcept_no} ({event.type})")
+                event.detail_error = True
+        for sink in self.sinks:
+            sink(event)
+        return event
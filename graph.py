@@ -0,0 +1,207 @@
+# graph.py
+# 회사 간 임원 겸직(interlocking directorate) / 공통 최대주주 그래프 색인
+#   - 사람: 정규화 성명 + 출생년월 → 해시 id,  주주: 정규화 주주명 → 해시 id
+#   - 회사별 최신 결과로 간선을 교체하므로 새 보고서가 들어오면 해당 회사만 증분 갱신
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from array import array
+
+import core
+
+_REPORT_ORDER = {"1분기보고서": 1, "반기보고서": 2, "3분기보고서": 3, "사업보고서": 4}
+_CORP_FORM_RE = re.compile(r"\(주\)|㈜|주식회사|\(유\)|유한회사|\bco\.?,?\s*ltd\b\.?|\binc\b\.?|\bcorp\b\.?", re.I)
+_NON_WORD_RE = re.compile(r"[\s·.,()\[\]\-]+")
+
+
+def normalize_name(name):
+    if core._is_missing(name):
+        return ""
+    s = unicodedata.normalize("NFKC", str(name))
+    s = _CORP_FORM_RE.sub("", s)
+    return _NON_WORD_RE.sub("", s).lower()
+
+
+def normalize_birth(ym):
+    """'1970.01' / '1970년 01월' / '197001' → '197001'."""
+    if core._is_missing(ym):
+        return ""
+    return re.sub(r"\D", "", str(ym))[:6]
+
+
+def node_id(*parts):
+    """정규화 키 → 부호 있는 64bit 해시 id (array('q')에 그대로 저장)."""
+    digest = hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _latest_year(records):
+    """가장 최근 사업연도의 행을 모두 남김.
+    get_execturives 는 사람별로 이미 1행만 남기며 보고서 우선순위가 1분기 쪽이라,
+    보고서종류로 다시 거르면 연중 계속 재직한 임원이 빠짐."""
+    if not records:
+        return []
+    top = max(core._to_number(r.get("사업연도")) or 0 for r in records)
+    return [r for r in records if (core._to_number(r.get("사업연도")) or 0) == top]
+
+
+def _current_holder(records):
+    """최대주주 변동 이력 중 변동일이 가장 늦은 1행 (= 현재 최대주주).
+    같은 변동이 여러 보고서에 반복되므로 동률이면 최근 (사업연도, 보고서종류) 행."""
+    def key(r):
+        changed = re.sub(r"\D", "", "" if core._is_missing(r.get("변동일")) else str(r.get("변동일")))
+        return (changed, core._to_number(r.get("사업연도")) or 0, _REPORT_ORDER.get(r.get("보고서종류"), 0))
+    return [max(records, key=key)] if records else []
+
+
+class _Bipartite:
+    """회사 ↔ 개체(사람/주주) 양방향 인접 배열. 회사 단위로 간선 전체를 교체."""
+
+    def __init__(self):
+        self.by_corp = {}     # corp_code → array('q') [개체 id]
+        self.by_node = {}     # 개체 id → list[corp_code]
+        self.labels = {}      # 개체 id → 표시용 dict
+
+    def replace(self, corp_code, nodes):
+        """nodes: {개체 id: label}. 기존 간선을 제거하고 새 간선으로 교체."""
+        for nid in self.by_corp.pop(corp_code, ()):
+            corps = self.by_node.get(nid)
+            if corps is not None:
+                corps.remove(corp_code)
+                if not corps:
+                    del self.by_node[nid]
+                    self.labels.pop(nid, None)
+        if not nodes:
+            return
+        self.by_corp[corp_code] = array("q", nodes)
+        for nid, label in nodes.items():
+            self.by_node.setdefault(nid, []).append(corp_code)
+            self.labels.setdefault(nid, label)
+
+    def shared(self, corp_code=None, min_companies=2):
+        """corp_code 없음: 여러 회사에 걸친 개체 목록 / 있음: 개체를 공유하는 다른 회사 목록."""
+        if corp_code is None:
+            return [
+                {**self.labels.get(nid, {}), "회사수": len(corps), "회사": sorted(corps)}
+                for nid, corps in self.by_node.items()
+                if len(corps) >= min_companies
+            ]
+        peers = {}
+        for nid in self.by_corp.get(corp_code, ()):
+            for other in self.by_node.get(nid, ()):
+                if other != corp_code:
+                    peers.setdefault(other, []).append(nid)
+        return [
+            {"공시코드": other, "공유수": len(nids), "공유": [self.labels.get(n, {}) for n in nids]}
+            for other, nids in sorted(peers.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+        ]
+
+    def to_json(self):
+        return {
+            "by_corp": {c: a.tolist() for c, a in self.by_corp.items()},
+            "labels": {str(n): l for n, l in self.labels.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        g = cls()
+        g.labels = {int(n): l for n, l in data.get("labels", {}).items()}
+        for corp_code, nids in data.get("by_corp", {}).items():
+            g.by_corp[corp_code] = array("q", nids)
+            for nid in nids:
+                g.by_node.setdefault(nid, []).append(corp_code)
+        return g
+
+
+class CorpGraph:
+    """임원(사람) / 최대주주(주주) 두 관계를 회사 단위로 색인."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(core.CACHE_DIR, "corp_graph.json")
+        self.officers = _Bipartite()
+        self.holders = _Bipartite()
+
+    # ── 갱신 ─────────────────────────────────────
+    def add_executives(self, corp_code, result, current_only=True):
+        """Execturives.get_execturives 결과(DataFrame/raw)를 회사 간선으로 반영.
+        current_only=True: 최근 사업연도에 재직한 임원만 (이전 연도에만 있던 임원 제외)."""
+        rows = core._records(result)
+        if current_only:
+            rows = _latest_year(rows)
+        nodes = {}
+        for r in rows:
+            name, birth = normalize_name(r.get("성명")), normalize_birth(r.get("출생년월"))
+            if name:
+                nodes[node_id("p", name, birth)] = {"성명": r.get("성명"), "출생년월": birth or None}
+        self.officers.replace(str(corp_code), nodes)
+        return len(nodes)
+
+    def add_shareholders(self, corp_code, result, current_only=True):
+        """Shareholders.get_major_shareholders 결과(DataFrame/raw)를 회사 간선으로 반영.
+        결과는 변동 이력이므로 current_only=True 면 현재 최대주주(최근 변동일) 1명만,
+        False 면 과거 최대주주까지 모두 연결."""
+        rows = core._records(result)
+        if current_only:
+            rows = _current_holder([r for r in rows if normalize_name(r.get("최대주주명"))])
+        nodes = {}
+        for r in rows:
+            name = normalize_name(r.get("최대주주명"))
+            if name:
+                nodes[node_id("h", name)] = {"최대주주명": r.get("최대주주명")}
+        self.holders.replace(str(corp_code), nodes)
+        return len(nodes)
+
+    def build(self, corp_codes, years=range(2021, 2026), executives=True, shareholders=True):
+        """회사 목록을 순회하며 두 메서드를 호출해 증분 갱신 (이미 있는 회사는 최신 결과로 교체).
+        조회 결과가 비어 있으면(API 실패 포함) 해당 관계는 기존 간선을 그대로 둠.
+        간선을 비우려면 add_executives/add_shareholders 에 빈 결과를 직접 넘김."""
+        n = 0
+        for corp_code in corp_codes:
+            if executives:
+                rows = core._records(core.Execturives.get_execturives(corp_code, years=years))
+                if rows:
+                    self.add_executives(corp_code, rows)
+            if shareholders:
+                rows = core._records(core.Shareholders.get_major_shareholders(corp_code, years=years))
+                if rows:
+                    self.add_shareholders(corp_code, rows)
+            n += 1
+        return n
+
+    # ── 조회 ─────────────────────────────────────
+    def interlocks(self, corp_code=None, min_companies=2):
+        """임원 겸직: corp_code 없으면 여러 회사에 재직 중인 사람, 있으면 임원을 공유하는 회사."""
+        return core._frame(self.officers.shared(corp_code, min_companies))
+
+    def common_controllers(self, corp_code=None, min_companies=2):
+        """공통 최대주주: corp_code 없으면 여러 회사의 최대주주인 주체, 있으면 최대주주를 공유하는 회사."""
+        return core._frame(self.holders.shared(corp_code, min_companies))
+
+    def companies_of(self, name, birth_ym=None):
+        """사람(성명+출생년월) 또는 주주명으로 연결된 회사 목록."""
+        if birth_ym is not None:
+            return sorted(self.officers.by_node.get(node_id("p", normalize_name(name), normalize_birth(birth_ym)), []))
+        return sorted(self.holders.by_node.get(node_id("h", normalize_name(name)), []))
+
+    # ── 저장 ─────────────────────────────────────
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".part"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"officers": self.officers.to_json(), "holders": self.holders.to_json()}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    @classmethod
+    def load(cls, path=None):
+        """저장된 그래프를 읽어오고, 없으면 빈 그래프 반환."""
+        g = cls(path)
+        try:
+            with open(g.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return g
+        g.officers = _Bipartite.from_json(data.get("officers", {}))
+        g.holders = _Bipartite.from_json(data.get("holders", {}))
+        return g
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def raw_mode():
+    """테스트는 기본적으로 raw 모드(list[dict])로 실행하고 끝나면 원래 모드로 복구."""
+    prev = core.result_mode
+    core.set_result_mode("raw")
+    yield
+    core.set_result_mode(prev)
+
+
+@pytest.fixture
+def dart_api(monkeypatch):
+    """core.get_json 을 URL 끝(엔드포인트명) → 응답 함수 dict 로 대체. 호출 기록은 .calls."""
+    class FakeDart:
+        def __init__(self):
+            self.routes = {}
+            self.calls = []
+
+        def __call__(self, url, params=None, timeout=30, **kwargs):
+            endpoint = url.rsplit("/", 1)[-1]
+            self.calls.append((endpoint, dict(params or {})))
+            handler = self.routes.get(endpoint)
+            return handler(params or {}) if handler else None
+
+    fake = FakeDart()
+    monkeypatch.setattr(core, "get_json", fake)
+    return fake
@@ -0,0 +1,100 @@
+import sys
+
+import pytest
+
+import bench_import
+import core
+
+# reprt_code: 11013 1분기, 11012 반기, 11014 3분기, 11011 사업
+EXECUTIVES = {
+    ("2024", "11011"): [
+        {"nm": "대표", "birth_ym": "1960.01", "ofcps": "대표이사"},
+        {"nm": "퇴임자", "birth_ym": "1955.03", "ofcps": "사내이사"},
+    ],
+    ("2025", "11013"): [
+        {"nm": "대표", "birth_ym": "1960.01", "ofcps": "대표이사"},
+        {"nm": "미상", "ofcps": "감사"},
+    ],
+    ("2025", "11012"): [
+        {"nm": "대표", "birth_ym": "1960.01", "ofcps": "대표이사"},
+    ],
+}
+
+# (사업연도, reprt_code, idx_cl_code) → 지표 목록. 부채비율은 값이 전부 비어 있음
+INDICATORS = {
+    ("2024", "11011", "M210000"): [{"idx_nm": "ROE", "idx_val": "12.5"}, {"idx_nm": "부채비율", "idx_val": ""}],
+    ("2025", "11013", "M210000"): [{"idx_nm": "ROE", "idx_val": "3"}, {"idx_nm": "부채비율", "idx_val": None}],
+    ("2025", "11013", "M220000"): [{"idx_nm": "유동비율", "idx_val": "1,200.5"}],
+    ("2025", "11012", "M210000"): [{"idx_nm": "부채비율", "idx_val": ""}],
+}
+
+CASH_IN = {
+    "estkRs.json": [{"pymd": "20240301", "stksen": "보통주", "amt": "1000", "se": "운영자금"},
+                    {"pymd": "", "stksen": "우선주", "amt": "500", "se": "시설자금"}],
+    "bdRs.json": [{"pymd": "2025-01-15", "bdnmn": "무보증사채", "amt": "3000", "se": "채무상환"}],
+    "stkdpRs.json": [{"pymd": "20230910", "stksen": "DR", "amt": "700", "se": "운영자금"}],
+}
+
+
+@pytest.fixture
+def core_api(dart_api):
+    def executives(params):
+        items = EXECUTIVES.get((str(params["bsns_year"]), str(params["reprt_code"])))
+        return {"status": "000", "list": items} if items else None
+
+    def indicators(params):
+        items = INDICATORS.get((str(params["bsns_year"]), str(params["reprt_code"]), params["idx_cl_code"]))
+        return {"status": "000", "list": items} if items else None
+
+    def cash_in(endpoint):
+        return lambda params: {"status": "000", "list": CASH_IN[endpoint]}
+
+    dart_api.routes["exctvSttus.json"] = executives
+    dart_api.routes["fnlttSinglIndx.json"] = indicators
+    for endpoint in CASH_IN:
+        dart_api.routes[endpoint] = cash_in(endpoint)
+    return dart_api
+
+
+@pytest.mark.parametrize("mode", ["raw", "pandas"])
+def test_raw_matches_pandas(core_api, mode):
+    if mode == "pandas":
+        pytest.importorskip("pandas")
+    core.set_result_mode(mode)
+
+    execs = core._records(core.Execturives.get_execturives("00000001", years=range(2024, 2026)))
+    assert [(r["성명"], r["사업연도"], r["보고서종류"]) for r in execs] == [
+        ("대표", "2025", "1분기보고서"),
+        ("미상", "2025", "1분기보고서"),
+        ("퇴임자", "2024", "사업보고서"),
+    ]
+
+    wide = core._records(core.FinancialIdx.get_financialidx("00000001", years=range(2024, 2026), pivot=True))
+    assert wide == [
+        {"사업연도": "2024", "보고서종류": "사업보고서", "ROE": 12.5, "유동비율": None},
+        {"사업연도": "2025", "보고서종류": "1분기보고서", "ROE": 3, "유동비율": 1200.5},
+    ]
+
+    for sort_desc, dates in [(True, ["2025-01-15", "2024-03-01", "2023-09-10", ""]),
+                             (False, ["2023-09-10", "2024-03-01", "2025-01-15", ""])]:
+        rows = core._records(core.CashIn.CashInSummary("00000001", sort_desc=sort_desc))
+        assert [r["납입기일"] for r in rows] == dates
+
+
+def test_import_core_loads_no_heavy_modules():
+    r = bench_import.measure(runs=1)
+    assert r["loaded"] == []
+
+
+def test_raw_mode_does_not_import_pandas(core_api, monkeypatch):
+    # 같은 프로세스의 다른 테스트가 이미 불러왔을 수 있으므로 잠시 지우고 core 의 지연 import 도 새로 만듦
+    for name in ("pandas", "numpy"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        monkeypatch.setattr(core, {"pandas": "pd", "numpy": "np"}[name], core._LazyModule(name))
+
+    core.Execturives.get_execturives("00000001", years=range(2024, 2026))
+    core.FinancialIdx.get_financialidx("00000001", years=range(2024, 2026), pivot=True)
+    core.CashIn.CashInSummary("00000001")
+
+    assert "pandas" not in sys.modules
+    assert "numpy" not in sys.modules
@@ -0,0 +1,75 @@
+import shutil
+import zipfile
+
+import core
+import documents
+
+
+def _make_zip(path, members):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, body in members.items():
+            zf.writestr(name, body)
+
+
+def _fake_get_zip(tmp_path, archives):
+    """core.get_zip 대체: 접수번호별 미리 만든 zip 을 dest_dir 로 복사해 반환."""
+    def get_zip(url, params=None, dest_dir=None, timeout=60, chunk_size=0):
+        src = archives.get(params["rcept_no"])
+        if src is None:
+            return None
+        dst = tmp_path / f"dl_{params['rcept_no']}.zip"
+        shutil.copy(src, dst)
+        return str(dst)
+    return get_zip
+
+
+def test_search_verify_is_case_insensitive_and_skips_member_names(tmp_path, monkeypatch):
+    _make_zip(tmp_path / "a.zip", {
+        "20240101000001.xml": "<DOCUMENT><P>전환가액 Refixing 조항</P></DOCUMENT>",
+        "20240101000001_00760.xml": "<DOCUMENT><P>부속서류</P></DOCUMENT>",
+    })
+    _make_zip(tmp_path / "b.zip", {"20240102000002.xml": "<DOCUMENT><P>소송 등의 제기</P></DOCUMENT>"})
+    archives = {"20240101000001": tmp_path / "a.zip", "20240102000002": tmp_path / "b.zip"}
+    monkeypatch.setattr(core, "get_zip", _fake_get_zip(tmp_path, archives))
+
+    idx = documents.DocumentIndex(str(tmp_path / "cache"))
+    assert idx.build(["20240101000001", {"접수번호": "20240102000002"}, "missing"]) == 2
+
+    hits = idx.search("refixing", verify=True)
+    assert [h["접수번호"] for h in hits] == ["20240101000001"]
+    assert "Refixing" in hits[0]["발췌"]
+    assert ".xml" not in hits[0]["발췌"]
+
+    # 멤버 파일명/접수번호가 본문 토큰으로 색인되지 않아야 함
+    assert idx.search("xml") == []
+    assert idx.search("20240102000002") == []
+    assert [h["접수번호"] for h in idx.search("소송")] == ["20240102000002"]
+
+
+def test_index_roundtrip(tmp_path):
+    idx = documents.DocumentIndex(str(tmp_path))
+    assert idx.add("20230000000001", "전환사채 발행결정")
+    assert not idx.add("20230000000001", "중복")
+    idx.add("20230000000002", "유상증자 결정")
+    idx.save()
+
+    loaded = documents.DocumentIndex.load(str(tmp_path))
+    assert len(loaded) == 2
+    assert [h["접수번호"] for h in loaded.search("발행결정")] == ["20230000000001"]
+    assert [h["접수번호"] for h in loaded.search("결정")] == ["20230000000002", "20230000000001"]
+
+
+def test_single_syllable_query_and_single_receipt(tmp_path, monkeypatch):
+    idx = documents.DocumentIndex(str(tmp_path))
+    idx.add("20230000000001", "전환사채 발행결정")
+    idx.add("20230000000002", "유상증자 결정")
+    idx.add("20230000000003", "소송 제기 (갑)")
+    assert [h["접수번호"] for h in idx.search("채")] == ["20230000000001"]
+    assert [h["접수번호"] for h in idx.search("정")] == ["20230000000002", "20230000000001"]
+    assert [h["접수번호"] for h in idx.search("갑")] == ["20230000000003"]
+    assert idx.search("을") == []
+
+    _make_zip(tmp_path / "a.zip", {"20240101000001.xml": "<DOCUMENT><P>본문</P></DOCUMENT>"})
+    monkeypatch.setattr(core, "get_zip", _fake_get_zip(tmp_path, {"20240101000001": tmp_path / "a.zip"}))
+    assert idx.build("20240101000001") == 1
+    assert "20240101000001" in idx
@@ -0,0 +1,191 @@
+import json
+
+import pytest
+
+import core
+import events
+
+FEED = {
+    "B": [
+        {"rcept_no": "20261015000001", "rcept_dt": "20261015", "corp_code": "001", "corp_name": "가",
+         "report_nm": "주요사항보고서(전환사채권발행결정)"},
+        {"rcept_no": "20261015000002", "rcept_dt": "20261015", "corp_code": "002", "corp_name": "나",
+         "report_nm": "주요사항보고서(자기주식취득결정)"},
+    ],
+    "C": [
+        {"rcept_no": "20261016000003", "rcept_dt": "20261016", "corp_code": "003", "corp_name": "다",
+         "report_nm": "[기재정정]증권신고서(채무증권)"},
+    ],
+    "I": [
+        {"rcept_no": "20261017000004", "rcept_dt": "20261017", "corp_code": "004", "corp_name": "라",
+         "report_nm": "최대주주변경"},
+    ],
+}
+
+
+@pytest.fixture
+def feed_api(dart_api):
+    dart_api.failing = set()
+
+    def feed(params):
+        if params["pblntf_ty"] in dart_api.failing:
+            return None
+        items = [it for it in FEED[params["pblntf_ty"]] if params["bgn_de"] <= it["rcept_dt"] <= params["end_de"]]
+        return {"status": "000", "list": items, "total_page": 1}
+
+    dart_api.routes["list.json"] = feed
+    dart_api.routes["cvbdIsDecsn.json"] = lambda p: {"status": "000", "list": [
+        {"rcept_no": "20261015000001", "cv_prc": "1000"}, {"rcept_no": "20261001000009", "cv_prc": "2000"}]}
+    dart_api.routes["bdRs.json"] = lambda p: {"status": "000", "list": [{"pymd": "20261030", "amt": "500"}]}
+    return dart_api
+
+
+def _state(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_state(path, last_date, seen=()):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"last_date": last_date, "seen": list(seen)}, f)
+
+
+def _list_starts(api):
+    return {p["pblntf_ty"]: p["bgn_de"] for ep, p in api.calls if ep == "list.json"}
+
+
+def test_scan_emits_typed_events_once(feed_api, tmp_path):
+    state = tmp_path / "state.json"
+    sink = tmp_path / "events.jsonl"
+    got = []
+    det = events.EventDetector([got.append, events.JsonlSink(str(sink))], state_path=str(state),
+                               fetch_detail=False)
+    evs = det.scan("20261015", "20261017")
+
+    assert [(e.type, e.rcept_no, e.amended) for e in evs] == [
+        (events.CONVERTIBLE_BOND, "20261015000001", False),
+        (events.BOND_ISSUE, "20261016000003", True),
+        (events.CONTROL_CHANGE, "20261017000004", False),
+    ]
+    assert got == evs
+    assert len(sink.read_text(encoding="utf-8").splitlines()) == 3
+    assert _state(state)["last_date"] == {"B": "20261017", "C": "20261017", "I": "20261017"}
+
+    again = events.EventDetector(state_path=str(state), fetch_detail=False)
+    assert again.scan(end_de="20261017") == []
+
+
+def test_feed_failure_does_not_advance_state(feed_api, tmp_path):
+    state = tmp_path / "state.json"
+    _write_state(state, "20261010")  # 이전 형식(공통 일자)도 읽음
+    feed_api.failing = {"B"}
+
+    det = events.EventDetector(state_path=str(state), fetch_detail=False)
+    with pytest.raises(events.FeedError) as exc:
+        det.scan(end_de="20261019")
+    assert [e.rcept_no for e in exc.value.events] == ["20261016000003", "20261017000004"]
+    assert _state(state)["last_date"] == {"B": "20261010", "C": "20261019", "I": "20261019"}
+
+    # 복구 후: B 는 실패 전 일자부터 다시 스캔, 이미 보낸 이벤트는 재전송하지 않음
+    feed_api.failing = set()
+    feed_api.calls.clear()
+    det = events.EventDetector(state_path=str(state), fetch_detail=False)
+    assert [e.rcept_no for e in det.scan(end_de="20261019")] == ["20261015000001"]
+    assert _list_starts(feed_api) == {"B": "20261010", "C": "20261019", "I": "20261019"}
+    assert _state(state)["last_date"] == {"B": "20261019", "C": "20261019", "I": "20261019"}
+
+
+def test_sink_failure_keeps_delivered_events(feed_api, tmp_path):
+    state = tmp_path / "state.json"
+    delivered = []
+
+    def flaky_sink(event):
+        if event.type == events.BOND_ISSUE:
+            raise OSError("disk full")
+        delivered.append(event.rcept_no)
+
+    det = events.EventDetector([flaky_sink], state_path=str(state), fetch_detail=False)
+    with pytest.raises(OSError):
+        det.scan("20261015", "20261017")
+    assert _state(state)["seen"] == ["20261015000001"]
+    assert _state(state)["last_date"] == {"B": "20261017"}
+
+    delivered.clear()
+    det = events.EventDetector([delivered.append], state_path=str(state), fetch_detail=False)
+    det.scan("20261015", "20261017")
+    assert [e.rcept_no for e in delivered] == ["20261016000003", "20261017000004"]
+
+
+def test_detail_routing_filters_to_receipt(feed_api, tmp_path):
+    feed_b = FEED["B"] + [
+        {"rcept_no": "20261015000005", "rcept_dt": "20261015", "corp_code": "005", "corp_name": "마",
+         "report_nm": "주요사항보고서(유상증자결정)"},
+    ]
+    feed_api.routes["list.json"] = lambda p: {"status": "000", "list": feed_b if p["pblntf_ty"] == "B" else []}
+    feed_api.routes["piicDecsn.json"] = lambda p: {"status": "000", "list": [
+        {"rcept_no": "20261015000005", "ic_mthn": "제3자배정증자", "nstk_ostk_cnt": "1,000,000"},
+        {"rcept_no": "20261015000099", "ic_mthn": "주주배정증자"},
+    ]}
+
+    det = events.EventDetector(state_path=str(tmp_path / "state.json"))
+    evs = {e.rcept_no: e for e in det.scan("20261015", "20261015")}
+
+    share = evs["20261015000005"]
+    assert share.type == events.SHARE_ISSUE
+    assert [(d["접수번호"], d["증자방식"]) for d in share.detail] == [("20261015000005", "제3자배정증자")]
+    assert ("piicDecsn.json", {"crtfc_key": core.api_key, "corp_code": "005",
+                               "bgn_de": "20261015", "end_de": "20261015"}) in feed_api.calls
+    assert not any(ep == "estkRs.json" for ep, _ in feed_api.calls)
+
+    cb = evs["20261015000001"]
+    assert [(d["접수번호"], d["주당 전환가액"]) for d in cb.detail] == [("20261015000001", "1000")]
+
+
+def test_detail_failure_is_flagged(feed_api, tmp_path):
+    feed_api.routes["cvbdIsDecsn.json"] = lambda p: None  # 예: '020' 요청 제한
+    feed_api.routes["bdRs.json"] = lambda p: {"status": "000", "list": []}  # '013' (empty_ok 응답)
+
+    det = events.EventDetector(state_path=str(tmp_path / "state.json"))
+    evs = {e.rcept_no: e for e in det.scan("20261015", "20261016")}
+
+    cb = evs["20261015000001"]
+    assert (cb.detail, cb.detail_error) == ([], True)
+    bond = evs["20261016000003"]
+    assert (bond.detail, bond.detail_error) == ([], False)
+    assert core.get_json is feed_api
+
+
+def test_detail_without_matching_receipt_is_empty(feed_api, tmp_path):
+    feed_api.routes["cvbdIsDecsn.json"] = lambda p: {"status": "000", "list": [
+        {"rcept_no": "20261015000099", "cv_prc": "2000"}]}
+
+    det = events.EventDetector(state_path=str(tmp_path / "state.json"))
+    (cb,) = det.scan("20261015", "20261015")
+    assert (cb.detail, cb.detail_error) == ([], False)
+
+
+def test_get_json_empty_ok_distinguishes_no_data(monkeypatch):
+    class Res:
+        def __init__(self, payload):
+            self.payload = payload
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self.payload
+
+    class Requests:
+        exceptions = type("exceptions", (), {"RequestException": OSError})
+        payload = {"status": "013", "message": "조회된 데이타가 없습니다."}
+
+        @classmethod
+        def get(cls, url, params=None, timeout=30):
+            return Res(cls.payload)
+
+    monkeypatch.setattr(core, "requests", Requests)
+    assert core.get_json(events.LIST_URL) is None
+    assert core.get_json(events.LIST_URL, empty_ok=True)["list"] == []
+
+    Requests.payload = {"status": "020", "message": "요청 제한을 초과하였습니다."}
+    assert core.get_json(events.LIST_URL, empty_ok=True) is None
@@ -0,0 +1,119 @@
+import pytest
+
+import core
+import graph
+
+# reprt_code: 11013 1분기, 11012 반기, 11014 3분기, 11011 사업
+EXECUTIVES = {
+    ("2024", "11011"): [
+        {"nm": "대표", "birth_ym": "1960.01", "ofcps": "대표이사"},
+        {"nm": "퇴임자", "birth_ym": "1955.03", "ofcps": "사내이사"},
+    ],
+    ("2025", "11013"): [
+        {"nm": "대표", "birth_ym": "1960.01", "ofcps": "대표이사"},
+        {"nm": "재직자", "birth_ym": "1970.05", "ofcps": "사외이사"},
+    ],
+    ("2025", "11012"): [
+        {"nm": "대표", "birth_ym": "1960.01", "ofcps": "대표이사"},
+        {"nm": "재직자", "birth_ym": "1970.05", "ofcps": "사외이사"},
+    ],
+    ("2025", "11014"): [
+        {"nm": "대표", "birth_ym": "1960.01", "ofcps": "대표이사"},
+        {"nm": "재직자", "birth_ym": "1970.05", "ofcps": "사외이사"},
+        {"nm": "신임", "birth_ym": "1980.07", "ofcps": "사내이사"},
+    ],
+}
+
+# 최대주주 변동 이력: 보고서마다 과거 변동까지 반복 기재
+SHAREHOLDERS = {
+    ("2025", "11013"): [
+        {"change_on": "2023.02.01", "mxmm_shrholdr_nm": "옛지주(주)", "trmend_qota_rt": "30"},
+    ],
+    ("2025", "11014"): [
+        {"change_on": "2023.02.01", "mxmm_shrholdr_nm": "옛지주(주)", "trmend_qota_rt": "30"},
+        {"change_on": "2025.06.15", "mxmm_shrholdr_nm": "새지주 주식회사", "trmend_qota_rt": "35"},
+    ],
+}
+
+
+@pytest.fixture(params=["raw", "pandas"])
+def mode(request):
+    if request.param == "pandas":
+        pytest.importorskip("pandas")
+    core.set_result_mode(request.param)
+    return request.param
+
+
+@pytest.fixture
+def company_api(dart_api):
+    def routes(table):
+        def handler(params):
+            items = table.get((str(params["bsns_year"]), str(params["reprt_code"])))
+            return {"status": "000", "list": items} if items else None
+        return handler
+    dart_api.routes["exctvSttus.json"] = routes(EXECUTIVES)
+    dart_api.routes["hyslrChgSttus.json"] = routes(SHAREHOLDERS)
+    return dart_api
+
+
+def test_add_executives_keeps_incumbents_of_latest_year(company_api, mode):
+    g = graph.CorpGraph()
+    result = core.Execturives.get_execturives("00000001", years=range(2024, 2026))
+    assert g.add_executives("00000001", result) == 3
+
+    assert g.companies_of("대표", "1960.01") == ["00000001"]
+    assert g.companies_of("재직자", "197005") == ["00000001"]
+    assert g.companies_of("신임", "1980.07") == ["00000001"]
+    assert g.companies_of("퇴임자", "1955.03") == []
+
+
+def test_add_shareholders_links_only_current_holder(company_api, mode):
+    g = graph.CorpGraph()
+    g.build(["00000001"], years=range(2025, 2026), executives=False)
+    assert g.companies_of("새지주") == ["00000001"]
+    assert g.companies_of("옛지주") == []
+
+    g.add_shareholders("00000002", core.Shareholders.get_major_shareholders("00000002", years=range(2025, 2026)),
+                       current_only=False)
+    assert g.companies_of("옛지주") == ["00000002"]
+
+
+def test_build_keeps_edges_when_refresh_fails(company_api, mode):
+    g = graph.CorpGraph()
+    g.build(["00000001"], years=range(2024, 2026))
+    assert g.companies_of("대표", "1960.01") == ["00000001"]
+    assert g.companies_of("새지주") == ["00000001"]
+
+    company_api.routes.clear()  # API 장애: 모든 조회 실패
+    g.build(["00000001"], years=range(2024, 2026))
+    assert g.companies_of("대표", "1960.01") == ["00000001"]
+    assert g.companies_of("새지주") == ["00000001"]
+
+    # 명시적으로 빈 결과를 넘기면 비움
+    g.add_executives("00000001", [])
+    g.add_shareholders("00000001", [])
+    assert g.companies_of("대표", "1960.01") == []
+    assert g.companies_of("새지주") == []
+
+
+def test_interlocks_and_incremental_replace(tmp_path):
+    g = graph.CorpGraph(str(tmp_path / "g.json"))
+    row = {"사업연도": "2025", "보고서종류": "사업보고서"}
+    g.add_executives("A", [{**row, "성명": "홍길동", "출생년월": "1970.01"}, {**row, "성명": "김철수", "출생년월": "1965.02"}])
+    g.add_executives("B", [{**row, "성명": "홍길동", "출생년월": "197001"}])
+    g.add_executives("C", [{**row, "성명": "홍길동", "출생년월": "1980.01"}])  # 동명이인
+
+    assert [(r["성명"], r["회사"]) for r in g.interlocks()] == [("홍길동", ["A", "B"])]
+    assert [r["공시코드"] for r in g.interlocks("A")] == ["B"]
+
+    g.add_shareholders("A", [{**row, "변동일": "2025.01.01", "최대주주명": "㈜지주"}])
+    g.add_shareholders("B", [{**row, "변동일": "2025.01.01", "최대주주명": "지주 주식회사"}])
+    assert [r["공시코드"] for r in g.common_controllers("A")] == ["B"]
+
+    # B 의 새 보고서: 임원 교체 → A 와의 겸직 관계 사라짐
+    g.add_executives("B", [{**row, "성명": "이영희", "출생년월": "1975.03"}])
+    assert g.interlocks() == []
+
+    g.save()
+    loaded = graph.CorpGraph.load(g.path)
+    assert [r["공시코드"] for r in loaded.common_controllers("B")] == ["A"]
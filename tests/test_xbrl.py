@@ -0,0 +1,87 @@
+import io
+import zipfile
+
+import xbrl
+
+_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"'
+    ' xmlns:xbrldi="http://xbrl.org/2006/xbrldi"'
+    ' xmlns:ifrs-full="http://xbrl.ifrs.org/taxonomy/2021-03-24/ifrs-full"'
+    ' xmlns:dart="http://dart.fss.or.kr/taxonomy/2021-06-30"'
+    ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+)
+
+
+def _context(cid, period, segment=""):
+    seg = f"<xbrli:segment>{segment}</xbrli:segment>" if segment else ""
+    return (f'<xbrli:context id="{cid}"><xbrli:entity><xbrli:identifier scheme="x">1</xbrli:identifier>{seg}'
+            f"</xbrli:entity><xbrli:period>{period}</xbrli:period></xbrli:context>")
+
+
+def _typed(value):
+    return f'<xbrldi:typedMember dimension="dart:SegmentAxis"><dart:SegmentDomain>{value}</dart:SegmentDomain></xbrldi:typedMember>'
+
+
+DURATION = "<xbrli:startDate>2023-01-01</xbrli:startDate><xbrli:endDate>2023-12-31</xbrli:endDate>"
+INSTANT = "<xbrli:instant>2023-12-31</xbrli:instant>"
+
+INSTANCE = (
+    _HEAD
+    # 팩트가 컨텍스트보다 먼저 나오는 경우
+    + '<ifrs-full:Assets contextRef="I" unitRef="KRW" decimals="-6">9000000</ifrs-full:Assets>'
+    + _context("D", DURATION)
+    + _context("SA", DURATION, _typed("A"))
+    + _context("SB", DURATION, _typed("B"))
+    + _context("SX", DURATION,
+               '<xbrldi:explicitMember dimension="ifrs-full:ConsolidatedAxis">ifrs-full:SeparateMember</xbrldi:explicitMember>')
+    + '<xbrli:unit id="KRW"><xbrli:measure>iso4217:KRW</xbrli:measure></xbrli:unit>'
+    + '<ifrs-full:Revenue contextRef="D" unitRef="KRW" decimals="-6">1000000</ifrs-full:Revenue>'
+    + '<ifrs-full:Revenue contextRef="SA" unitRef="KRW" decimals="-6">400000</ifrs-full:Revenue>'
+    + '<ifrs-full:Revenue contextRef="SB" unitRef="KRW" decimals="-6">600000</ifrs-full:Revenue>'
+    + '<ifrs-full:Revenue contextRef="SX" unitRef="KRW" decimals="-6">700000</ifrs-full:Revenue>'
+    + '<dart:EntityName contextRef="D">회사</dart:EntityName>'
+    + '<dart:Missing contextRef="D" unitRef="KRW" xsi:nil="true"/>'
+    + _context("I", INSTANT)
+    + "</xbrli:xbrl>"
+)
+
+
+def _facts():
+    return list(xbrl.iter_instance(io.BytesIO(INSTANCE.encode("utf-8")), "20240101000001"))
+
+
+def test_iter_instance_long_format():
+    facts = {(f["계정ID"], f["컨텍스트"]): f for f in _facts()}
+    assert len(facts) == 7
+
+    rev = facts[("ifrs-full_Revenue", "D")]
+    assert rev["접수번호"] == "20240101000001"
+    assert (rev["기간유형"], rev["시작일"], rev["종료일"]) == ("duration", "2023-01-01", "2023-12-31")
+    assert rev["수치"] == 1000000.0 and rev["단위"] == "KRW" and rev["차원"] is None
+
+    name = facts[("dart_EntityName", "D")]
+    assert name["값"] == "회사" and name["수치"] is None
+    assert facts[("dart_Missing", "D")]["값"] is None
+
+    # 컨텍스트가 뒤에 정의된 팩트도 기간이 채워짐
+    assets = facts[("ifrs-full_Assets", "I")]
+    assert (assets["기간유형"], assets["종료일"]) == ("instant", "2023-12-31")
+
+
+def test_iter_instance_dimensions():
+    facts = {f["컨텍스트"]: f for f in _facts() if f["계정ID"] == "ifrs-full_Revenue"}
+    assert facts["SX"]["차원"] == "ifrs-full:ConsolidatedAxis=ifrs-full:SeparateMember"
+    # typedMember 값이 달라야 구분됨
+    assert facts["SA"]["차원"] == "dart:SegmentAxis=A"
+    assert facts["SB"]["차원"] == "dart:SegmentAxis=B"
+
+
+def test_iter_facts_reads_only_instance_members(tmp_path):
+    path = tmp_path / "20240101000001.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("entity_2023-12-31.xbrl", INSTANCE)
+        zf.writestr("entity_2023-12-31_lab-ko.xml", "<link:linkbase/>")
+    facts = list(xbrl.iter_facts(str(path)))
+    assert len(facts) == 7
+    assert {f["접수번호"] for f in facts} == {"20240101000001"}
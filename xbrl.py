@@ -0,0 +1,213 @@
+# xbrl.py
+# XBRL 재무제표 원본(zip) → 스트리밍 파싱 → 세로형(long) 팩트 테이블 → 컬럼형(parquet) 저장소
+#   - 원본: OpenDART fnlttXbrl.xml (접수번호별) 또는 로컬에 내려받은 zip/.xbrl 파일
+#   - 저장소: 접수번호당 parquet 파일 1개 (pyarrow 필요, 선택 의존성)
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+
+import core
+
+XBRL_URL = "https://opendart.fss.or.kr/api/fnlttXbrl.xml"
+
+_XBRLI = "{http://www.xbrl.org/2003/instance}"
+_XBRLDI = "{http://xbrl.org/2006/xbrldi}"
+_XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+
+FACT_COLS = ["접수번호", "계정ID", "컨텍스트", "기간유형", "시작일", "종료일", "차원", "단위", "소수점", "값", "수치"]
+
+
+def download_xbrl(rcept_no, reprt_code="11011", dest_dir=None, timeout=120):
+    """fnlttXbrl.xml zip을 임시파일로 저장하고 경로 반환. 실패 시 None (삭제는 호출 측)."""
+    return core.get_zip(
+        XBRL_URL,
+        params={"crtfc_key": core.api_key, "rcept_no": rcept_no, "reprt_code": reprt_code},
+        dest_dir=dest_dir,
+        timeout=timeout,
+    )
+
+
+def _parse_context(elem):
+    ctx = {"기간유형": None, "시작일": None, "종료일": None, "차원": None}
+    period = elem.find(f"{_XBRLI}period")
+    if period is not None:
+        instant = period.findtext(f"{_XBRLI}instant")
+        if instant:
+            ctx.update(기간유형="instant", 종료일=instant.strip())
+        else:
+            ctx.update(기간유형="duration",
+                       시작일=(period.findtext(f"{_XBRLI}startDate") or "").strip() or None,
+                       종료일=(period.findtext(f"{_XBRLI}endDate") or "").strip() or None)
+    members = [f"{m.get('dimension')}={(m.text or '').strip()}" for m in elem.iter(f"{_XBRLDI}explicitMember")]
+    members += [f"{m.get('dimension')}={''.join(m.itertext()).strip()}" for m in elem.iter(f"{_XBRLDI}typedMember")]
+    if members:
+        ctx["차원"] = ";".join(sorted(members))
+    return ctx
+
+
+def _to_float(s):
+    try:
+        return float(s)
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_instance(f, rcept_no=None):
+    """XBRL 인스턴스 문서(파일 객체)를 iterparse 로 한 요소씩 읽어 팩트 dict 를 yield.
+    처리한 최상위 요소는 바로 비워 메모리 사용량이 문서 크기와 무관하게 유지됨.
+    컨텍스트는 보통 팩트보다 먼저 나오지만, 뒤에 정의된 경우에 한해 해당 팩트만 보류했다가 마지막에 내보냄."""
+    prefixes = {}
+    contexts = {}
+    pending = []
+    root = None
+    depth = 0
+
+    def fact(elem, ctx):
+        ns, _, local = elem.tag[1:].partition("}") if elem.tag.startswith("{") else ("", "", elem.tag)
+        value = None if elem.get(_XSI_NIL) == "true" else (elem.text or "").strip()
+        unit = elem.get("unitRef")
+        rec = {
+            "접수번호": rcept_no,
+            "계정ID": f"{prefixes.get(ns, ns)}_{local}" if ns else local,
+            "컨텍스트": elem.get("contextRef"),
+            "단위": unit,
+            "소수점": elem.get("decimals"),
+            "값": value,
+            "수치": _to_float(value) if unit else None,
+        }
+        rec.update(ctx)
+        return {c: rec.get(c) for c in FACT_COLS}
+
+    for event, item in ET.iterparse(f, events=("start-ns", "start", "end")):
+        if event == "start-ns":
+            prefix, uri = item
+            prefixes.setdefault(uri, prefix or "")
+            continue
+        if event == "start":
+            if root is None:
+                root = item
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth != 1:
+            continue
+        elem = item
+        if elem.tag == f"{_XBRLI}context":
+            contexts[elem.get("id")] = _parse_context(elem)
+        elif elem.get("contextRef") is not None:
+            ctx = contexts.get(elem.get("contextRef"))
+            if ctx is None:
+                pending.append(fact(elem, {}))
+            else:
+                yield fact(elem, ctx)
+        root.clear()
+
+    for rec in pending:
+        rec.update(contexts.get(rec["컨텍스트"], {}))
+        yield rec
+
+
+def _instance_members(zf):
+    # DART XBRL zip: 인스턴스(.xbrl) + 택소노미(.xsd) + 링크베이스(.xml) → 인스턴스만 파싱
+    return [n for n in zf.namelist() if n.lower().endswith(".xbrl")]
+
+
+def iter_facts(source, rcept_no=None):
+    """zip(다운로드/로컬) 또는 .xbrl 파일 경로에서 팩트를 스트리밍으로 yield."""
+    if rcept_no is None:
+        rcept_no = os.path.basename(str(source)).split(".")[0].split("_")[0]
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            for name in _instance_members(zf):
+                with zf.open(name) as f:
+                    yield from iter_instance(f, rcept_no)
+    else:
+        with open(source, "rb") as f:
+            yield from iter_instance(f, rcept_no)
+
+# ──────────────────────────────────────────────
+# 컬럼형 저장소 (접수번호당 parquet 1개, row group 단위로 나눠 기록)
+# ──────────────────────────────────────────────
+class FactStore:
+    def __init__(self, path=None, batch_size=50_000):
+        self.path = path or os.path.join(core.CACHE_DIR, "xbrl_facts")
+        self.batch_size = batch_size
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def _pa():
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("FactStore 는 pyarrow 가 필요합니다: pip install pyarrow") from e
+        return pa, pq
+
+    def _file(self, rcept_no):
+        return os.path.join(self.path, f"{rcept_no}.parquet")
+
+    def __contains__(self, rcept_no):
+        return os.path.exists(self._file(rcept_no))
+
+    def filings(self):
+        return sorted(n[:-len(".parquet")] for n in os.listdir(self.path) if n.endswith(".parquet"))
+
+    def append(self, rcept_no, facts):
+        """팩트 iterable 을 batch_size 단위 row group 으로 기록 (전체를 메모리에 모으지 않음). 기록 건수 반환."""
+        pa, pq = self._pa()
+        schema = pa.schema([(c, pa.float64() if c == "수치" else pa.string()) for c in FACT_COLS])
+        target = self._file(rcept_no)
+        tmp = target + ".part"
+        n = 0
+        batch = []
+        try:
+            with pq.ParquetWriter(tmp, schema) as writer:
+                for rec in facts:
+                    batch.append(rec)
+                    if len(batch) >= self.batch_size:
+                        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                        n += len(batch)
+                        batch = []
+                if batch or n == 0:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    n += len(batch)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        os.replace(tmp, target)
+        return n
+
+    def read(self, rcept_nos=None, columns=None):
+        """저장된 팩트를 읽어 현재 결과 형식(DataFrame 또는 raw list[dict])으로 반환."""
+        pa, pq = self._pa()
+        names = self.filings() if rcept_nos is None else [r for r in map(str, rcept_nos) if r in self]
+        if not names:
+            return core._frame([])
+        table = pa.concat_tables([pq.read_table(self._file(r), columns=columns) for r in names])
+        if core._raw():
+            return table.to_pylist()
+        return table.to_pandas()
+
+
+def load_filing(rcept_no, reprt_code="11011", store=None, source=None, refresh=False):
+    """한 공시의 XBRL 을 팩트 저장소에 적재하고 기록 건수 반환 (실패 0, 이미 있으면 -1).
+    source 를 주면 다운로드 대신 로컬 zip/.xbrl 파일을 사용."""
+    store = store or FactStore()
+    rcept_no = str(rcept_no).strip()
+    if rcept_no in store and not refresh:
+        return -1
+    zip_path = None
+    if source is None:
+        zip_path = source = download_xbrl(rcept_no, reprt_code, dest_dir=store.path)
+        if zip_path is None:
+            return 0
+    try:
+        return store.append(rcept_no, iter_facts(source, rcept_no))
+    except (zipfile.BadZipFile, ET.ParseError) as e:
+        print(f"XBRL Error: {rcept_no}: {e}")
+        return 0
+    finally:
+        if zip_path is not None:
+            os.remove(zip_path)